@@ -0,0 +1,450 @@
+"""stats summary tables
+
+Revision ID: 2164a23596b7
+Revises: ae7352e1c370
+Create Date: 2026-10-19 09:14:02.512843
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "2164a23596b7"
+down_revision: Union[str, Sequence[str], None] = "ae7352e1c370"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Write paths never update shared summary rows. Statement-level triggers
+# aggregate the rows a statement changed and append signed deltas to
+# daily_stats_deltas / artwork_import_deltas; stats_compact() folds them into
+# daily_stats, artwork_imports and artwork_daily_imports in key order. The only
+# rows updated in place are the per-project counters in project_stats, locked
+# in project_id order. Days are bucketed in UTC.
+STATS_FUNCTIONS_SQL = """
+CREATE TYPE stats_place_delta AS (
+    project_id integer,
+    external_id integer,
+    day date,
+    visited_on date,
+    sign integer
+);
+
+CREATE FUNCTION stats_place_to_delta(p_place project_places, p_sign integer)
+RETURNS stats_place_delta AS $$
+    SELECT ROW(
+        p_place.project_id,
+        p_place.external_id,
+        (p_place.created_at AT TIME ZONE 'UTC')::date,
+        CASE
+            WHEN p_place.visited THEN (p_place.visited_at AT TIME ZONE 'UTC')::date
+        END,
+        p_sign
+    )::stats_place_delta
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE FUNCTION stats_apply_place_deltas(p_deltas stats_place_delta[])
+RETURNS void AS $$
+BEGIN
+    PERFORM 1
+    FROM project_stats
+    WHERE project_id IN (
+        SELECT project_id
+        FROM unnest(p_deltas)
+        GROUP BY project_id
+        HAVING sum(sign) <> 0
+            OR sum(CASE WHEN visited_on IS NOT NULL THEN sign ELSE 0 END) <> 0
+    )
+    ORDER BY project_id
+    FOR UPDATE;
+
+    WITH changes AS (
+        SELECT
+            project_id,
+            sum(sign) AS places,
+            sum(CASE WHEN visited_on IS NOT NULL THEN sign ELSE 0 END) AS visited
+        FROM unnest(p_deltas)
+        GROUP BY project_id
+    ),
+    updated AS (
+        UPDATE project_stats AS s
+        SET places_count = s.places_count + c.places,
+            visited_count = s.visited_count + c.visited
+        FROM changes AS c
+        WHERE s.project_id = c.project_id AND (c.places <> 0 OR c.visited <> 0)
+        RETURNING
+            s.created_on,
+            s.places_count - c.places > 0
+                AND s.visited_count - c.visited = s.places_count - c.places
+                AS was_completed,
+            s.places_count > 0 AND s.visited_count = s.places_count
+                AS is_completed
+    ),
+    contributions AS (
+        SELECT day, 0 AS completed, sign AS imported, 0 AS visited
+        FROM unnest(p_deltas)
+        UNION ALL
+        SELECT visited_on, 0, 0, sign
+        FROM unnest(p_deltas)
+        WHERE visited_on IS NOT NULL
+        UNION ALL
+        SELECT created_on, is_completed::integer - was_completed::integer, 0, 0
+        FROM updated
+    )
+    INSERT INTO daily_stats_deltas (
+        day, projects_created, projects_completed, places_imported, places_visited
+    )
+    SELECT day, 0, sum(completed), sum(imported), sum(visited)
+    FROM contributions
+    GROUP BY day
+    HAVING sum(completed) <> 0 OR sum(imported) <> 0 OR sum(visited) <> 0;
+
+    INSERT INTO artwork_import_deltas (day, external_id, imports)
+    SELECT day, external_id, sum(sign)
+    FROM unnest(p_deltas)
+    GROUP BY day, external_id
+    HAVING sum(sign) <> 0;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION stats_on_projects_change() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO project_stats (project_id, created_on, places_count, visited_count)
+        SELECT id, (created_at AT TIME ZONE 'UTC')::date, 0, 0
+        FROM new_projects;
+
+        INSERT INTO daily_stats_deltas (
+            day, projects_created, projects_completed, places_imported,
+            places_visited
+        )
+        SELECT (created_at AT TIME ZONE 'UTC')::date, count(*), 0, 0, 0
+        FROM new_projects
+        GROUP BY 1;
+    ELSE
+        WITH removed AS (
+            DELETE FROM project_stats
+            WHERE project_id IN (SELECT id FROM old_projects)
+            RETURNING
+                created_on,
+                places_count > 0 AND visited_count = places_count AS completed
+        )
+        INSERT INTO daily_stats_deltas (
+            day, projects_created, projects_completed, places_imported,
+            places_visited
+        )
+        SELECT created_on, -count(*), -count(*) FILTER (WHERE completed), 0, 0
+        FROM removed
+        GROUP BY created_on;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION stats_on_places_change() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM stats_apply_place_deltas(ARRAY(
+            SELECT stats_place_to_delta(n, 1) FROM new_places AS n
+        ));
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM stats_apply_place_deltas(ARRAY(
+            SELECT stats_place_to_delta(o, -1) FROM old_places AS o
+        ));
+    ELSE
+        PERFORM stats_apply_place_deltas(ARRAY(
+            SELECT stats_place_to_delta(o, -1) FROM old_places AS o
+            UNION ALL
+            SELECT stats_place_to_delta(n, 1) FROM new_places AS n
+        ));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION project_places_set_visited_at() RETURNS trigger AS $$
+BEGIN
+    IF NOT NEW.visited THEN
+        NEW.visited_at := NULL;
+    ELSIF TG_OP = 'INSERT' THEN
+        NEW.visited_at := COALESCE(NEW.visited_at, now());
+    ELSIF NOT OLD.visited THEN
+        NEW.visited_at := now();
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION stats_compact() RETURNS void AS $$
+DECLARE
+    v_daily daily_stats[];
+    v_artworks artwork_daily_imports[];
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtext('stats_compact'));
+
+    WITH moved AS (
+        DELETE FROM daily_stats_deltas RETURNING *
+    )
+    SELECT array_agg(
+        ROW(day, projects_created, projects_completed, places_imported,
+            places_visited)::daily_stats
+        ORDER BY day
+    )
+    INTO v_daily
+    FROM (
+        SELECT
+            day,
+            sum(projects_created) AS projects_created,
+            sum(projects_completed) AS projects_completed,
+            sum(places_imported) AS places_imported,
+            sum(places_visited) AS places_visited
+        FROM moved
+        GROUP BY day
+    ) AS totals;
+
+    INSERT INTO daily_stats AS d
+    SELECT * FROM unnest(v_daily) ORDER BY day
+    ON CONFLICT (day) DO UPDATE SET
+        projects_created = d.projects_created + EXCLUDED.projects_created,
+        projects_completed = d.projects_completed + EXCLUDED.projects_completed,
+        places_imported = d.places_imported + EXCLUDED.places_imported,
+        places_visited = d.places_visited + EXCLUDED.places_visited;
+
+    DELETE FROM daily_stats
+    WHERE day IN (SELECT day FROM unnest(v_daily))
+        AND projects_created = 0
+        AND projects_completed = 0
+        AND places_imported = 0
+        AND places_visited = 0;
+
+    WITH moved AS (
+        DELETE FROM artwork_import_deltas RETURNING *
+    )
+    SELECT array_agg(
+        ROW(day, external_id, imports)::artwork_daily_imports
+        ORDER BY day, external_id
+    )
+    INTO v_artworks
+    FROM (
+        SELECT day, external_id, sum(imports) AS imports
+        FROM moved
+        GROUP BY day, external_id
+    ) AS totals;
+
+    INSERT INTO artwork_daily_imports AS a
+    SELECT * FROM unnest(v_artworks) ORDER BY day, external_id
+    ON CONFLICT (day, external_id) DO UPDATE SET
+        imports = a.imports + EXCLUDED.imports;
+
+    DELETE FROM artwork_daily_imports
+    WHERE (day, external_id) IN (SELECT day, external_id FROM unnest(v_artworks))
+        AND imports = 0;
+
+    INSERT INTO artwork_imports AS a (external_id, imports)
+    SELECT external_id, sum(imports)
+    FROM unnest(v_artworks)
+    GROUP BY external_id
+    ORDER BY external_id
+    ON CONFLICT (external_id) DO UPDATE SET imports = a.imports + EXCLUDED.imports;
+
+    DELETE FROM artwork_imports
+    WHERE external_id IN (SELECT external_id FROM unnest(v_artworks))
+        AND imports = 0;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION stats_rebuild() RETURNS void AS $$
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtext('stats_compact'));
+    LOCK TABLE projects, project_places IN SHARE MODE;
+
+    DELETE FROM daily_stats_deltas;
+    DELETE FROM artwork_import_deltas;
+    DELETE FROM project_stats;
+    DELETE FROM daily_stats;
+    DELETE FROM artwork_imports;
+    DELETE FROM artwork_daily_imports;
+
+    INSERT INTO project_stats (project_id, created_on, places_count, visited_count)
+    SELECT
+        p.id,
+        (p.created_at AT TIME ZONE 'UTC')::date,
+        count(pp.id),
+        count(pp.id) FILTER (WHERE pp.visited)
+    FROM projects AS p
+    LEFT JOIN project_places AS pp ON pp.project_id = p.id
+    GROUP BY p.id;
+
+    INSERT INTO artwork_daily_imports (day, external_id, imports)
+    SELECT (created_at AT TIME ZONE 'UTC')::date, external_id, count(*)
+    FROM project_places
+    GROUP BY 1, 2;
+
+    INSERT INTO artwork_imports (external_id, imports)
+    SELECT external_id, sum(imports)
+    FROM artwork_daily_imports
+    GROUP BY external_id;
+
+    INSERT INTO daily_stats (
+        day, projects_created, projects_completed, places_imported, places_visited
+    )
+    SELECT day, sum(created), sum(completed), sum(imported), sum(visited)
+    FROM (
+        SELECT
+            created_on AS day,
+            1 AS created,
+            CASE
+                WHEN places_count > 0 AND visited_count = places_count THEN 1
+                ELSE 0
+            END AS completed,
+            0 AS imported,
+            0 AS visited
+        FROM project_stats
+        UNION ALL
+        SELECT day, 0, 0, imports, 0
+        FROM artwork_daily_imports
+        UNION ALL
+        SELECT (visited_at AT TIME ZONE 'UTC')::date, 0, 0, 0, 1
+        FROM project_places
+        WHERE visited AND visited_at IS NOT NULL
+    ) AS contributions
+    GROUP BY day;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+STATS_TRIGGERS_SQL = """
+CREATE TRIGGER project_places_visited_at
+BEFORE INSERT OR UPDATE OF visited ON project_places
+FOR EACH ROW EXECUTE FUNCTION project_places_set_visited_at();
+
+CREATE TRIGGER projects_stats_insert
+AFTER INSERT ON projects
+REFERENCING NEW TABLE AS new_projects
+FOR EACH STATEMENT EXECUTE FUNCTION stats_on_projects_change();
+
+CREATE TRIGGER projects_stats_delete
+AFTER DELETE ON projects
+REFERENCING OLD TABLE AS old_projects
+FOR EACH STATEMENT EXECUTE FUNCTION stats_on_projects_change();
+
+CREATE TRIGGER project_places_stats_insert
+AFTER INSERT ON project_places
+REFERENCING NEW TABLE AS new_places
+FOR EACH STATEMENT EXECUTE FUNCTION stats_on_places_change();
+
+CREATE TRIGGER project_places_stats_update
+AFTER UPDATE ON project_places
+REFERENCING OLD TABLE AS old_places NEW TABLE AS new_places
+FOR EACH STATEMENT EXECUTE FUNCTION stats_on_places_change();
+
+CREATE TRIGGER project_places_stats_delete
+AFTER DELETE ON project_places
+REFERENCING OLD TABLE AS old_places
+FOR EACH STATEMENT EXECUTE FUNCTION stats_on_places_change();
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "project_places",
+        sa.Column("visited_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.execute(
+        "UPDATE project_places SET visited_at = updated_at "
+        "WHERE visited AND visited_at IS NULL"
+    )
+
+    op.create_table(
+        "project_stats",
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column("created_on", sa.Date(), nullable=False),
+        sa.Column("places_count", sa.Integer(), nullable=False),
+        sa.Column("visited_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("project_id"),
+    )
+    op.create_table(
+        "daily_stats",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("projects_created", sa.Integer(), nullable=False),
+        sa.Column("projects_completed", sa.Integer(), nullable=False),
+        sa.Column("places_imported", sa.Integer(), nullable=False),
+        sa.Column("places_visited", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("day"),
+    )
+    op.create_table(
+        "artwork_imports",
+        sa.Column("external_id", sa.Integer(), nullable=False),
+        sa.Column("imports", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("external_id"),
+    )
+    op.create_index(
+        "ix_artwork_imports_imports",
+        "artwork_imports",
+        ["imports", "external_id"],
+    )
+    op.create_table(
+        "artwork_daily_imports",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("external_id", sa.Integer(), nullable=False),
+        sa.Column("imports", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("day", "external_id"),
+    )
+    op.create_table(
+        "daily_stats_deltas",
+        sa.Column("id", sa.BigInteger(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("projects_created", sa.Integer(), nullable=False),
+        sa.Column("projects_completed", sa.Integer(), nullable=False),
+        sa.Column("places_imported", sa.Integer(), nullable=False),
+        sa.Column("places_visited", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_daily_stats_deltas_day", "daily_stats_deltas", ["day"])
+    op.create_table(
+        "artwork_import_deltas",
+        sa.Column("id", sa.BigInteger(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("external_id", sa.Integer(), nullable=False),
+        sa.Column("imports", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_artwork_import_deltas_day", "artwork_import_deltas", ["day"])
+
+    op.execute(STATS_FUNCTIONS_SQL)
+    op.execute(STATS_TRIGGERS_SQL)
+    op.execute("SELECT stats_rebuild()")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER project_places_stats_delete ON project_places")
+    op.execute("DROP TRIGGER project_places_stats_update ON project_places")
+    op.execute("DROP TRIGGER project_places_stats_insert ON project_places")
+    op.execute("DROP TRIGGER projects_stats_delete ON projects")
+    op.execute("DROP TRIGGER projects_stats_insert ON projects")
+    op.execute("DROP TRIGGER project_places_visited_at ON project_places")
+    op.execute("DROP FUNCTION stats_rebuild()")
+    op.execute("DROP FUNCTION stats_compact()")
+    op.execute("DROP FUNCTION project_places_set_visited_at()")
+    op.execute("DROP FUNCTION stats_on_places_change()")
+    op.execute("DROP FUNCTION stats_on_projects_change()")
+    op.execute("DROP FUNCTION stats_apply_place_deltas(stats_place_delta[])")
+    op.execute("DROP FUNCTION stats_place_to_delta(project_places, integer)")
+    op.execute("DROP TYPE stats_place_delta")
+
+    op.drop_index("ix_artwork_import_deltas_day", table_name="artwork_import_deltas")
+    op.drop_table("artwork_import_deltas")
+    op.drop_index("ix_daily_stats_deltas_day", table_name="daily_stats_deltas")
+    op.drop_table("daily_stats_deltas")
+    op.drop_table("artwork_daily_imports")
+    op.drop_index("ix_artwork_imports_imports", table_name="artwork_imports")
+    op.drop_table("artwork_imports")
+    op.drop_table("daily_stats")
+    op.drop_table("project_stats")
+    op.drop_column("project_places", "visited_at")
@@ -0,0 +1,39 @@
+import argparse
+
+from src.database import SessionLocal
+from src.services.stats import compact_stats, rebuild_stats
+
+
+def _compact_stats() -> None:
+    db = SessionLocal()
+    try:
+        compact_stats(db)
+    finally:
+        db.close()
+    print("Stats deltas compacted")
+
+
+def _rebuild_stats() -> None:
+    db = SessionLocal()
+    try:
+        rebuild_stats(db)
+    finally:
+        db.close()
+    print("Stats summary tables rebuilt")
+
+
+COMMANDS = {
+    "compact-stats": _compact_stats,
+    "rebuild-stats": _rebuild_stats,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m src.cli")
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    args = parser.parse_args()
+    COMMANDS[args.command]()
+
+
+if __name__ == "__main__":
+    main()
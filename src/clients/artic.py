@@ -1,7 +1,10 @@
+import time
 from dataclasses import dataclass
 
 import httpx
 
+from src.profiling import record_external_call
+
 
 ARTIC_BASE_URL = "https://api.artic.edu/api/v1"
 
@@ -30,8 +33,20 @@ class ArticClient:
     async def get_artwork(self, external_id: int) -> ArticArtwork:
         url = f"{self._base_url}/artworks/{external_id}"
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.get(url)
+        started = time.perf_counter()
+        status_code: int | None = None
+        try:
+            async with httpx.AsyncClient(timeout=self._timeout) as client:
+                response = await client.get(url)
+            status_code = response.status_code
+        finally:
+            record_external_call(
+                "artic",
+                "GET",
+                url,
+                status_code,
+                (time.perf_counter() - started) * 1000,
+            )
 
         if response.status_code == 404:
             raise ArticArtworkNotFoundError(f"Artwork {external_id} was not found")
@@ -1,5 +1,30 @@
+import os
+import secrets
+
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
 from src.clients.artic import ArticClient
 
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+
+_admin_bearer = HTTPBearer(auto_error=False)
+
 
 def get_artic_client() -> ArticClient:
     return ArticClient()
+
+
+def require_admin_token(
+    credentials: HTTPAuthorizationCredentials | None = Depends(_admin_bearer),
+) -> None:
+    if credentials is None:
+        raise HTTPException(
+            status_code=401,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if not ADMIN_TOKEN or not secrets.compare_digest(
+        credentials.credentials.encode(), ADMIN_TOKEN.encode()
+    ):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
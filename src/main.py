@@ -1,6 +1,11 @@
 from fastapi import FastAPI
 
+from src.database import engine
+from src.deps import ADMIN_TOKEN
+from src.profiling import PROFILING_ENABLED, instrument_engine, profiling_middleware
+from src.routers.admin import router as admin_router
 from src.routers.projects import router as projects_router
+from src.routers.stats import router as stats_router
 
 app = FastAPI(
     title="Travel Planner API",
@@ -10,6 +15,14 @@ app = FastAPI(
     openapi_url="/openapi.json",
 )
 app.include_router(projects_router)
+app.include_router(stats_router)
+
+if PROFILING_ENABLED:
+    instrument_engine(engine)
+    app.middleware("http")(profiling_middleware)
+    # Captures hold SQL and URLs; without a token nothing can read them.
+    if ADMIN_TOKEN:
+        app.include_router(admin_router)
 
 
 @app.get("/")
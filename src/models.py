@@ -1,6 +1,7 @@
 from datetime import date, datetime
 
 from sqlalchemy import (
+    BigInteger,
     Integer,
     Boolean,
     String,
@@ -8,6 +9,7 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
     UniqueConstraint,
 )
 from sqlalchemy.sql import func
@@ -34,7 +36,7 @@ class Project(Base):
     )
 
     places: Mapped[list["ProjectPlace"]] = relationship(
-        back_populates="project", cascade="all, delete-orphan"
+        back_populates="project", cascade="all, delete-orphan", passive_deletes=True
     )
 
 
@@ -54,6 +56,9 @@ class ProjectPlace(Base):
     image_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
     visited: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    visited_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -65,3 +70,64 @@ class ProjectPlace(Base):
     )
 
     project: Mapped[Project] = relationship(back_populates="places")
+
+
+# Summary tables below are maintained by database triggers (see the
+# "stats summary tables" migration) and rebuilt with `python -m src.cli
+# rebuild-stats`. Triggers append to the *_deltas tables, which `python -m
+# src.cli compact-stats` folds into the summaries. Days are UTC calendar days.
+
+
+class ProjectStats(Base):
+    __tablename__ = "project_stats"
+
+    project_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    created_on: Mapped[date] = mapped_column(Date, nullable=False)
+    places_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    visited_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class DailyStats(Base):
+    __tablename__ = "daily_stats"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    projects_created: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    projects_completed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    places_imported: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    places_visited: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class ArtworkImports(Base):
+    __tablename__ = "artwork_imports"
+    __table_args__ = (Index("ix_artwork_imports_imports", "imports", "external_id"),)
+
+    external_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    imports: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class ArtworkDailyImports(Base):
+    __tablename__ = "artwork_daily_imports"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    external_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    imports: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class DailyStatsDelta(Base):
+    __tablename__ = "daily_stats_deltas"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    day: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    projects_created: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    projects_completed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    places_imported: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    places_visited: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class ArtworkImportDelta(Base):
+    __tablename__ = "artwork_import_deltas"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    day: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    external_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    imports: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -0,0 +1,259 @@
+import functools
+import inspect
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from types import FrameType
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy import Engine, event
+
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+PROFILING_SLOW_REQUEST_MS = float(os.getenv("PROFILING_SLOW_REQUEST_MS", "0"))
+PROFILING_INTERVAL_MS = float(os.getenv("PROFILING_INTERVAL_MS", "5"))
+PROFILING_MAX_CAPTURES = int(os.getenv("PROFILING_MAX_CAPTURES", "50"))
+PROFILING_ENABLED = PROFILING_SAMPLE_RATE > 0 or PROFILING_SLOW_REQUEST_MS > 0
+
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@dataclass(slots=True)
+class SqlStatementRecord:
+    statement: str
+    duration_ms: float
+
+
+@dataclass(slots=True)
+class ExternalCallRecord:
+    service: str
+    method: str
+    url: str
+    status_code: int | None
+    duration_ms: float
+
+
+@dataclass(eq=False)
+class ProfileCapture:
+    method: str
+    path: str
+    sampled: bool
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    reason: str | None = None
+    status_code: int | None = None
+    duration_ms: float = 0.0
+    interval_ms: float = PROFILING_INTERVAL_MS
+    stacks: Counter[str] = field(default_factory=Counter)
+    sql_statements: list[SqlStatementRecord] = field(default_factory=list)
+    external_calls: list[ExternalCallRecord] = field(default_factory=list)
+    thread_id: int | None = None
+    frame: FrameType | None = None
+
+    def sample(self, frame: FrameType | None) -> None:
+        # Only frames above the endpoint wrapper belong to this request; if the
+        # wrapper is not on the stack (e.g. an async endpoint awaiting I/O) the
+        # thread is busy with something else and the sample is dropped.
+        stack: list[str] = []
+        while frame is not None and frame is not self.frame:
+            stack.append(_frame_label(frame))
+            frame = frame.f_back
+        if frame is not None and stack:
+            self.stacks[";".join(reversed(stack))] += 1
+
+    def folded(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.items())
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    filename = code.co_filename
+    if "site-packages" in filename:
+        filename = filename.rpartition("site-packages" + os.sep)[2]
+    elif filename.startswith(_ROOT_DIR):
+        filename = os.path.relpath(filename, _ROOT_DIR)
+    # ";" separates frames in the folded format.
+    label = f"{code.co_qualname} ({filename}:{code.co_firstlineno})"
+    return label.replace(";", ",")
+
+
+class _Sampler:
+    def __init__(self, interval_ms: float) -> None:
+        self._interval = interval_ms / 1000
+        self._captures: set[ProfileCapture] = set()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def add(self, capture: ProfileCapture) -> None:
+        with self._lock:
+            self._captures.add(capture)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="profiling-sampler", daemon=True
+                )
+                self._thread.start()
+        self._wakeup.set()
+
+    def remove(self, capture: ProfileCapture) -> None:
+        with self._lock:
+            self._captures.discard(capture)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._captures:
+                    self._wakeup.clear()
+                else:
+                    frames = sys._current_frames()
+                    for capture in self._captures:
+                        if capture.thread_id is not None:
+                            capture.sample(frames.get(capture.thread_id))
+            self._wakeup.wait()
+            time.sleep(self._interval)
+
+
+class ProfileStore:
+    def __init__(self, max_captures: int) -> None:
+        self._captures: deque[ProfileCapture] = deque(maxlen=max_captures)
+        self._lock = threading.Lock()
+
+    def add(self, capture: ProfileCapture) -> None:
+        with self._lock:
+            self._captures.append(capture)
+
+    def all(self) -> list[ProfileCapture]:
+        with self._lock:
+            return list(reversed(self._captures))
+
+    def get(self, capture_id: str) -> ProfileCapture | None:
+        with self._lock:
+            for capture in self._captures:
+                if capture.id == capture_id:
+                    return capture
+        return None
+
+
+_current_capture: ContextVar[ProfileCapture | None] = ContextVar(
+    "profile_capture", default=None
+)
+_sampler = _Sampler(PROFILING_INTERVAL_MS)
+profile_store = ProfileStore(PROFILING_MAX_CAPTURES)
+
+
+def _bind_to_capture(call: Callable[..., Any]) -> Callable[..., Any]:
+    if inspect.iscoroutinefunction(call):
+
+        @functools.wraps(call)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            capture = _current_capture.get()
+            if capture is not None:
+                capture.thread_id = threading.get_ident()
+                capture.frame = sys._getframe()
+            return await call(*args, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(call)
+    def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+        capture = _current_capture.get()
+        if capture is not None:
+            capture.thread_id = threading.get_ident()
+            capture.frame = sys._getframe()
+        return call(*args, **kwargs)
+
+    return sync_wrapper
+
+
+class ProfiledRoute(APIRoute):
+    """Route that lets the sampler find the thread running its endpoint.
+
+    Sync endpoints run in a threadpool worker, async ones on the event loop,
+    so the endpoint call itself records where it runs for the active capture.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        if self.dependant.call is not None:
+            self.dependant.call = _bind_to_capture(self.dependant.call)
+
+
+def record_external_call(
+    service: str, method: str, url: str, status_code: int | None, duration_ms: float
+) -> None:
+    capture = _current_capture.get()
+    if capture is not None:
+        capture.external_calls.append(
+            ExternalCallRecord(service, method, url, status_code, duration_ms)
+        )
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("profiling_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["profiling_started"].pop()
+    capture = _current_capture.get()
+    if capture is not None:
+        capture.sql_statements.append(
+            SqlStatementRecord(statement, (time.perf_counter() - started) * 1000)
+        )
+
+
+def _handle_error(exception_context) -> None:
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("profiling_started"):
+        conn.info["profiling_started"].pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+async def profiling_middleware(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    if request.url.path.startswith("/admin"):
+        return await call_next(request)
+
+    sampled = random.random() < PROFILING_SAMPLE_RATE
+    if not sampled and PROFILING_SLOW_REQUEST_MS <= 0:
+        return await call_next(request)
+
+    capture = ProfileCapture(
+        method=request.method, path=request.url.path, sampled=sampled
+    )
+    token = _current_capture.set(capture)
+    _sampler.add(capture)
+    started = time.perf_counter()
+    try:
+        response = await call_next(request)
+        capture.status_code = response.status_code
+        return response
+    except Exception:
+        capture.status_code = 500
+        raise
+    finally:
+        capture.duration_ms = (time.perf_counter() - started) * 1000
+        _sampler.remove(capture)
+        _current_capture.reset(token)
+        capture.frame = None
+
+        if 0 < PROFILING_SLOW_REQUEST_MS <= capture.duration_ms:
+            capture.reason = "slow"
+        elif capture.sampled:
+            capture.reason = "sampled"
+        if capture.reason is not None:
+            profile_store.add(capture)
@@ -0,0 +1,64 @@
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import PlainTextResponse
+
+from src.deps import require_admin_token
+from src.profiling import ProfileCapture, profile_store
+from src.schemas import ProfileResponse, ProfileSummaryResponse
+
+router = APIRouter(
+    prefix="/admin/profiles",
+    tags=["admin"],
+    dependencies=[Depends(require_admin_token)],
+)
+
+
+def _get_capture_or_404(capture_id: str) -> ProfileCapture:
+    capture = profile_store.get(capture_id)
+    if capture is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return capture
+
+
+def _summary_fields(capture: ProfileCapture) -> dict:
+    return {
+        "id": capture.id,
+        "method": capture.method,
+        "path": capture.path,
+        "reason": capture.reason,
+        "status_code": capture.status_code,
+        "started_at": capture.started_at,
+        "duration_ms": capture.duration_ms,
+        "interval_ms": capture.interval_ms,
+        "samples_count": capture.stacks.total(),
+        "sql_statements_count": len(capture.sql_statements),
+        "external_calls_count": len(capture.external_calls),
+    }
+
+
+@router.get("", response_model=list[ProfileSummaryResponse])
+def list_profiles_endpoint() -> list[ProfileSummaryResponse]:
+    return [
+        ProfileSummaryResponse(**_summary_fields(capture))
+        for capture in profile_store.all()
+    ]
+
+
+@router.get("/{capture_id}", response_model=ProfileResponse)
+def get_profile_endpoint(capture_id: str) -> ProfileResponse:
+    capture = _get_capture_or_404(capture_id)
+    return ProfileResponse(
+        **_summary_fields(capture),
+        sql_statements=capture.sql_statements,
+        external_calls=capture.external_calls,
+    )
+
+
+@router.get("/{capture_id}/folded", response_class=PlainTextResponse)
+def download_profile_folded_endpoint(capture_id: str) -> PlainTextResponse:
+    capture = _get_capture_or_404(capture_id)
+    return PlainTextResponse(
+        capture.folded(),
+        headers={
+            "Content-Disposition": f'attachment; filename="profile-{capture.id}.folded"'
+        },
+    )
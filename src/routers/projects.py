@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, status
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.orm import Session
 
 from src.clients.artic import ArticClient
 from src.database import get_db
 from src.deps import get_artic_client
+from src.profiling import ProfiledRoute
 from src.schemas import (
+    ProjectBulkDeleteResponse,
     ProjectCreateRequest,
     ProjectPlaceCreateRequest,
     ProjectPlaceResponse,
@@ -13,19 +17,21 @@ from src.schemas import (
     ProjectUpdateRequest,
     ProjectWithPlacesResponse,
 )
+from src.serialization import json_response
 from src.services.projects import (
     add_project_place,
+    bulk_delete_projects,
     create_project,
     delete_project,
-    get_project,
+    get_project_json,
     get_project_place,
-    list_project_places,
-    list_projects,
+    list_project_places_json,
+    list_projects_json,
     update_project,
     update_project_place,
 )
 
-router = APIRouter(prefix="/projects", tags=["projects"])
+router = APIRouter(prefix="/projects", tags=["projects"], route_class=ProfiledRoute)
 
 
 @router.post(
@@ -40,15 +46,23 @@ async def create_project_endpoint(
 
 
 @router.get("", response_model=list[ProjectResponse])
-def list_projects_endpoint(db: Session = Depends(get_db)) -> list[ProjectResponse]:
-    return list_projects(db)
+def list_projects_endpoint(db: Session = Depends(get_db)) -> Response:
+    return json_response(list_projects_json(db))
+
+
+@router.delete("", response_model=ProjectBulkDeleteResponse)
+def bulk_delete_projects_endpoint(
+    ids: list[int] | None = Query(default=None, max_length=1000),
+    created_before: datetime | None = None,
+    updated_before: datetime | None = None,
+    db: Session = Depends(get_db),
+) -> ProjectBulkDeleteResponse:
+    return bulk_delete_projects(db, ids, created_before, updated_before)
 
 
 @router.get("/{project_id}", response_model=ProjectWithPlacesResponse)
-def get_project_endpoint(
-    project_id: int, db: Session = Depends(get_db)
-) -> ProjectWithPlacesResponse:
-    return get_project(db, project_id)
+def get_project_endpoint(project_id: int, db: Session = Depends(get_db)) -> Response:
+    return json_response(get_project_json(db, project_id))
 
 
 @router.patch("/{project_id}", response_model=ProjectWithPlacesResponse)
@@ -84,8 +98,8 @@ async def add_project_place_endpoint(
 def list_project_places_endpoint(
     project_id: int,
     db: Session = Depends(get_db),
-) -> list[ProjectPlaceResponse]:
-    return list_project_places(db, project_id)
+) -> Response:
+    return json_response(list_project_places_json(db, project_id))
 
 
 @router.get("/{project_id}/places/{place_id}", response_model=ProjectPlaceResponse)
@@ -0,0 +1,21 @@
+from datetime import date
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from src.database import get_db
+from src.profiling import ProfiledRoute
+from src.schemas import StatsResponse
+from src.services.stats import get_stats
+
+router = APIRouter(prefix="/stats", tags=["stats"], route_class=ProfiledRoute)
+
+
+@router.get("", response_model=StatsResponse)
+def get_stats_endpoint(
+    date_from: date | None = None,
+    date_to: date | None = None,
+    top_artworks_limit: int = Query(default=10, ge=1, le=100),
+    db: Session = Depends(get_db),
+) -> StatsResponse:
+    return get_stats(db, date_from, date_to, top_artworks_limit)
@@ -21,6 +21,11 @@ class ProjectUpdateRequest(BaseModel):
     start_date: date | None = None
 
 
+class ProjectBulkDeleteResponse(BaseModel):
+    deleted: int
+    remaining: int
+
+
 class ProjectPlaceCreateRequest(BaseModel):
     external_id: int = Field(gt=0)
     notes: str | None = Field(default=None, max_length=5000)
@@ -61,3 +66,63 @@ class ProjectResponse(BaseModel):
 
 class ProjectWithPlacesResponse(ProjectResponse):
     places: list[ProjectPlaceResponse]
+
+
+class DailyVisitsResponse(BaseModel):
+    day: date
+    places_visited: int
+
+
+class ArtworkImportsResponse(BaseModel):
+    external_id: int
+    imports: int
+
+
+class StatsResponse(BaseModel):
+    date_from: date | None
+    date_to: date | None
+    projects_created: int
+    projects_completed: int
+    completion_rate: float
+    places_imported: int
+    places_visited: int
+    places_visited_per_day: list[DailyVisitsResponse]
+    top_artworks: list[ArtworkImportsResponse]
+
+
+class ProfileSqlStatementResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    statement: str
+    duration_ms: float
+
+
+class ProfileExternalCallResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    service: str
+    method: str
+    url: str
+    status_code: int | None
+    duration_ms: float
+
+
+class ProfileSummaryResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    method: str
+    path: str
+    reason: str
+    status_code: int | None
+    started_at: datetime
+    duration_ms: float
+    interval_ms: float
+    samples_count: int
+    sql_statements_count: int
+    external_calls_count: int
+
+
+class ProfileResponse(ProfileSummaryResponse):
+    sql_statements: list[ProfileSqlStatementResponse]
+    external_calls: list[ProfileExternalCallResponse]
@@ -0,0 +1,32 @@
+from typing import Any, TypedDict
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+from src.schemas import ProjectPlaceResponse, ProjectResponse, ProjectWithPlacesResponse
+
+
+# Row-shaped TypedDicts mirror the response models field for field, so the
+# precompiled adapters below serialize plain dicts built from SQL rows to the
+# exact bytes FastAPI would produce for the models, without validating them.
+def _row_type(model: type[BaseModel], **overrides: Any) -> type:
+    fields = {name: field.annotation for name, field in model.model_fields.items()}
+    fields.update(overrides)
+    return TypedDict(f"{model.__name__.removesuffix('Response')}Row", fields)
+
+
+ProjectPlaceRow = _row_type(ProjectPlaceResponse)
+ProjectRow = _row_type(ProjectResponse)
+ProjectWithPlacesRow = _row_type(
+    ProjectWithPlacesResponse, places=list[ProjectPlaceRow]
+)
+
+project_places_adapter = TypeAdapter(list[ProjectPlaceRow])
+projects_adapter = TypeAdapter(list[ProjectRow])
+project_with_places_adapter = TypeAdapter(ProjectWithPlacesRow)
+
+
+def json_response(content: bytes, status_code: int = 200) -> Response:
+    return Response(
+        content=content, status_code=status_code, media_type="application/json"
+    )
@@ -1,5 +1,7 @@
+from datetime import datetime
+
 from fastapi import HTTPException
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, Select, and_, delete, exists, func, select
 from sqlalchemy.orm import Session, selectinload
 
 from src.clients.artic import (
@@ -11,42 +13,59 @@ from src.clients.artic import (
 from src.models import Project, ProjectPlace
 from src.schemas import (
     PlaceImportRequest,
+    ProjectBulkDeleteResponse,
     ProjectCreateRequest,
     ProjectPlaceCreateRequest,
     ProjectPlaceResponse,
     ProjectPlaceUpdateRequest,
-    ProjectResponse,
     ProjectUpdateRequest,
     ProjectWithPlacesResponse,
 )
+from src.serialization import (
+    project_places_adapter,
+    project_with_places_adapter,
+    projects_adapter,
+)
+
 
+BULK_DELETE_BATCH_SIZE = 500
 
-def _compute_completed(places: list[ProjectPlace]) -> bool:
-    return len(places) > 0 and all(place.visited for place in places)
 
+# list_projects_json applies the same rule in SQL (bool_and over the places).
+def _compute_completed(visited: list[bool]) -> bool:
+    return len(visited) > 0 and all(visited)
 
-def _to_project_response(project: Project) -> ProjectResponse:
-    return ProjectResponse(
+
+def _to_project_with_places_response(project: Project) -> ProjectWithPlacesResponse:
+    return ProjectWithPlacesResponse(
         id=project.id,
         name=project.name,
         description=project.description,
         start_date=project.start_date,
-        completed=_compute_completed(project.places),
+        completed=_compute_completed([place.visited for place in project.places]),
         places_count=len(project.places),
         created_at=project.created_at,
         updated_at=project.updated_at,
+        places=[_to_project_place_response(place) for place in project.places],
     )
 
 
-def _to_project_with_places_response(project: Project) -> ProjectWithPlacesResponse:
-    base = _to_project_response(project)
-    return ProjectWithPlacesResponse(**base.model_dump(), places=project.places)
-
-
 def _to_project_place_response(project_place: ProjectPlace) -> ProjectPlaceResponse:
     return ProjectPlaceResponse.model_validate(project_place)
 
 
+# Column lists in response field order, for the fast JSON read paths.
+_PROJECT_PLACE_COLUMNS = [
+    getattr(ProjectPlace, name) for name in ProjectPlaceResponse.model_fields
+]
+
+
+def _ensure_project_exists(db: Session, project_id: int) -> None:
+    stmt = select(Project.id).where(Project.id == project_id)
+    if db.execute(stmt).first() is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+
 def _get_project_or_404(db: Session, project_id: int) -> Project:
     stmt = (
         select(Project)
@@ -136,10 +155,30 @@ async def create_project(
     return get_project(db, project.id)
 
 
-def list_projects(db: Session) -> list[ProjectResponse]:
-    stmt = select(Project).options(selectinload(Project.places)).order_by(Project.id)
-    projects = db.execute(stmt).scalars().all()
-    return [_to_project_response(project) for project in projects]
+def _list_projects_stmt() -> Select:
+    places_count = func.count(ProjectPlace.id)
+    return (
+        select(
+            Project.id,
+            Project.name,
+            Project.description,
+            Project.start_date,
+            and_(places_count > 0, func.bool_and(ProjectPlace.visited)).label(
+                "completed"
+            ),
+            places_count.label("places_count"),
+            Project.created_at,
+            Project.updated_at,
+        )
+        .outerjoin(ProjectPlace, ProjectPlace.project_id == Project.id)
+        .group_by(Project.id)
+        .order_by(Project.id)
+    )
+
+
+def list_projects_json(db: Session) -> bytes:
+    rows = [dict(row) for row in db.execute(_list_projects_stmt()).mappings()]
+    return projects_adapter.dump_json(rows)
 
 
 def get_project(db: Session, project_id: int) -> ProjectWithPlacesResponse:
@@ -147,6 +186,43 @@ def get_project(db: Session, project_id: int) -> ProjectWithPlacesResponse:
     return _to_project_with_places_response(project)
 
 
+def get_project_json(db: Session, project_id: int) -> bytes:
+    project = db.execute(
+        select(
+            Project.id,
+            Project.name,
+            Project.description,
+            Project.start_date,
+            Project.created_at,
+            Project.updated_at,
+        ).where(Project.id == project_id)
+    ).one_or_none()
+    if project is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    places = [
+        dict(row)
+        for row in db.execute(
+            select(*_PROJECT_PLACE_COLUMNS)
+            .where(ProjectPlace.project_id == project_id)
+            .order_by(ProjectPlace.id)
+        ).mappings()
+    ]
+    return project_with_places_adapter.dump_json(
+        {
+            "id": project.id,
+            "name": project.name,
+            "description": project.description,
+            "start_date": project.start_date,
+            "completed": _compute_completed([place["visited"] for place in places]),
+            "places_count": len(places),
+            "created_at": project.created_at,
+            "updated_at": project.updated_at,
+            "places": places,
+        }
+    )
+
+
 def update_project(
     db: Session, project_id: int, payload: ProjectUpdateRequest
 ) -> ProjectWithPlacesResponse:
@@ -156,10 +232,13 @@ def update_project(
     for key, value in updates.items():
         setattr(project, key, value)
 
+    # Reload only the server-set updated_at; places are already loaded and
+    # building the response before commit keeps them from being expired.
+    db.flush()
+    db.refresh(project, ["updated_at"])
+    response = _to_project_with_places_response(project)
     db.commit()
-    db.refresh(project)
-    _ = project.places
-    return _to_project_with_places_response(project)
+    return response
 
 
 async def add_project_place(
@@ -210,17 +289,15 @@ async def add_project_place(
     return _to_project_place_response(project_place)
 
 
-def list_project_places(db: Session, project_id: int) -> list[ProjectPlaceResponse]:
-    _get_project_or_404(db, project_id)
+def list_project_places_json(db: Session, project_id: int) -> bytes:
+    _ensure_project_exists(db, project_id)
     stmt = (
-        select(ProjectPlace)
+        select(*_PROJECT_PLACE_COLUMNS)
         .where(ProjectPlace.project_id == project_id)
         .order_by(ProjectPlace.id)
     )
-    project_places = db.execute(stmt).scalars().all()
-    return [
-        _to_project_place_response(project_place) for project_place in project_places
-    ]
+    rows = [dict(row) for row in db.execute(stmt).mappings()]
+    return project_places_adapter.dump_json(rows)
 
 
 def get_project_place(
@@ -247,14 +324,87 @@ def update_project_place(
     return _to_project_place_response(project_place)
 
 
-def delete_project(db: Session, project_id: int) -> None:
-    project = _get_project_or_404(db, project_id)
+def _has_no_visited_places() -> ColumnElement[bool]:
+    return ~exists().where(
+        ProjectPlace.project_id == Project.id,
+        ProjectPlace.visited.is_(True),
+    )
+
 
-    if any(place.visited for place in project.places):
+def delete_project(db: Session, project_id: int) -> None:
+    stmt = (
+        delete(Project)
+        .where(Project.id == project_id, _has_no_visited_places())
+        .execution_options(synchronize_session=False)
+    )
+    result = db.execute(stmt)
+
+    if result.rowcount == 0:
+        db.rollback()
+        project_exists = db.execute(
+            select(Project.id).where(Project.id == project_id)
+        ).first()
+        if project_exists is None:
+            raise HTTPException(status_code=404, detail="Project not found")
         raise HTTPException(
             status_code=409,
             detail="Project cannot be deleted because it has visited places",
         )
 
-    db.delete(project)
     db.commit()
+
+
+def bulk_delete_projects(
+    db: Session,
+    ids: list[int] | None = None,
+    created_before: datetime | None = None,
+    updated_before: datetime | None = None,
+    batch_size: int = BULK_DELETE_BATCH_SIZE,
+) -> ProjectBulkDeleteResponse:
+    filters: list[ColumnElement[bool]] = [_has_no_visited_places()]
+    if ids is not None:
+        filters.append(Project.id.in_(ids))
+    if created_before is not None:
+        filters.append(Project.created_at < created_before)
+    if updated_before is not None:
+        # Place edits do not touch projects.updated_at, so check places too.
+        filters.append(Project.updated_at < updated_before)
+        filters.append(
+            ~exists().where(
+                ProjectPlace.project_id == Project.id,
+                ProjectPlace.updated_at >= updated_before,
+            )
+        )
+
+    if ids is None and created_before is None and updated_before is None:
+        raise HTTPException(
+            status_code=422,
+            detail="At least one of ids, created_before or updated_before is required",
+        )
+
+    # Each batch runs in its own short transaction; rows locked by concurrent
+    # requests are skipped instead of waited on.
+    batch_ids = (
+        select(Project.id)
+        .where(*filters)
+        .order_by(Project.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    stmt = (
+        delete(Project)
+        .where(Project.id.in_(batch_ids.scalar_subquery()))
+        .execution_options(synchronize_session=False)
+    )
+
+    deleted = 0
+    while True:
+        batch_deleted = db.execute(stmt).rowcount
+        db.commit()
+        if batch_deleted == 0:
+            break
+        deleted += batch_deleted
+
+    # Rows still matching were locked by concurrent requests and skipped.
+    remaining = db.scalar(select(func.count()).select_from(Project).where(*filters))
+    return ProjectBulkDeleteResponse(deleted=deleted, remaining=remaining)
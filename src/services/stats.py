@@ -0,0 +1,168 @@
+from datetime import date
+
+from fastapi import HTTPException
+from sqlalchemy import ColumnElement, func, literal, select, text, union, union_all
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Subquery
+
+from src.models import (
+    ArtworkDailyImports,
+    ArtworkImportDelta,
+    ArtworkImports,
+    DailyStats,
+    DailyStatsDelta,
+)
+from src.schemas import ArtworkImportsResponse, DailyVisitsResponse, StatsResponse
+
+_DAILY_COLUMNS = (
+    "day",
+    "projects_created",
+    "projects_completed",
+    "places_imported",
+    "places_visited",
+)
+
+
+def _date_range_filters(
+    column: ColumnElement[date], date_from: date | None, date_to: date | None
+) -> list[ColumnElement[bool]]:
+    filters: list[ColumnElement[bool]] = []
+    if date_from is not None:
+        filters.append(column >= date_from)
+    if date_to is not None:
+        filters.append(column <= date_to)
+    return filters
+
+
+def _daily_rows(date_from: date | None, date_to: date | None) -> Subquery:
+    # Summaries plus the deltas not compacted yet, so responses include every
+    # committed write.
+    return union_all(
+        *(
+            select(*(getattr(model, name) for name in _DAILY_COLUMNS)).where(
+                *_date_range_filters(model.day, date_from, date_to)
+            )
+            for model in (DailyStats, DailyStatsDelta)
+        )
+    ).subquery("daily")
+
+
+def _top_artworks(
+    db: Session, date_from: date | None, date_to: date | None, limit: int
+) -> list[ArtworkImportsResponse]:
+    if date_from is None and date_to is None:
+        pending = (
+            select(
+                ArtworkImportDelta.external_id,
+                func.sum(ArtworkImportDelta.imports).label("imports"),
+            )
+            .group_by(ArtworkImportDelta.external_id)
+            .cte("pending")
+        )
+        # Only artworks with pending deltas can change rank, so the true top
+        # `limit` lies within the indexed leaders widened by that many rows.
+        leaders = (
+            select(ArtworkImports.external_id)
+            .order_by(ArtworkImports.imports.desc(), ArtworkImports.external_id.desc())
+            .limit(
+                literal(limit)
+                + select(func.count()).select_from(pending).scalar_subquery()
+            )
+        )
+        candidates = union(leaders, select(pending.c.external_id)).subquery()
+        imports = func.coalesce(ArtworkImports.imports, 0) + func.coalesce(
+            pending.c.imports, 0
+        )
+        stmt = (
+            select(candidates.c.external_id, imports.label("imports"))
+            .outerjoin(
+                ArtworkImports,
+                ArtworkImports.external_id == candidates.c.external_id,
+            )
+            .outerjoin(pending, pending.c.external_id == candidates.c.external_id)
+            .where(imports > 0)
+            .order_by(imports.desc(), candidates.c.external_id.desc())
+            .limit(limit)
+        )
+    else:
+        rows = union_all(
+            *(
+                select(model.external_id, model.imports).where(
+                    *_date_range_filters(model.day, date_from, date_to)
+                )
+                for model in (ArtworkDailyImports, ArtworkImportDelta)
+            )
+        ).subquery("artworks")
+        imports = func.sum(rows.c.imports)
+        stmt = (
+            select(rows.c.external_id, imports.label("imports"))
+            .group_by(rows.c.external_id)
+            .having(imports > 0)
+            .order_by(imports.desc(), rows.c.external_id.desc())
+            .limit(limit)
+        )
+
+    return [
+        ArtworkImportsResponse(external_id=external_id, imports=imports)
+        for external_id, imports in db.execute(stmt).all()
+    ]
+
+
+def get_stats(
+    db: Session,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    top_artworks_limit: int = 10,
+) -> StatsResponse:
+    if date_from is not None and date_to is not None and date_from > date_to:
+        raise HTTPException(
+            status_code=422, detail="date_from must not be after date_to"
+        )
+
+    daily = _daily_rows(date_from, date_to)
+
+    totals_stmt = select(
+        func.coalesce(func.sum(daily.c.projects_created), 0),
+        func.coalesce(func.sum(daily.c.projects_completed), 0),
+        func.coalesce(func.sum(daily.c.places_imported), 0),
+        func.coalesce(func.sum(daily.c.places_visited), 0),
+    )
+    projects_created, projects_completed, places_imported, places_visited = db.execute(
+        totals_stmt
+    ).one()
+
+    visited = func.sum(daily.c.places_visited)
+    visits_stmt = (
+        select(daily.c.day, visited)
+        .group_by(daily.c.day)
+        .having(visited > 0)
+        .order_by(daily.c.day)
+    )
+    places_visited_per_day = [
+        DailyVisitsResponse(day=day, places_visited=count)
+        for day, count in db.execute(visits_stmt).all()
+    ]
+
+    return StatsResponse(
+        date_from=date_from,
+        date_to=date_to,
+        projects_created=projects_created,
+        projects_completed=projects_completed,
+        completion_rate=(
+            projects_completed / projects_created if projects_created else 0.0
+        ),
+        places_imported=places_imported,
+        places_visited=places_visited,
+        places_visited_per_day=places_visited_per_day,
+        top_artworks=_top_artworks(db, date_from, date_to, top_artworks_limit),
+    )
+
+
+def compact_stats(db: Session) -> None:
+    db.execute(text("SELECT stats_compact()"))
+    db.commit()
+
+
+def rebuild_stats(db: Session) -> None:
+    db.execute(text("SELECT stats_rebuild()"))
+    db.commit()
@@ -0,0 +1,19 @@
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine
+
+from tests.support import app_client, migrated_database
+
+
+@pytest.fixture
+def db_engine() -> Iterator[Engine]:
+    with migrated_database("test") as engine:
+        yield engine
+
+
+@pytest.fixture
+def client(db_engine: Engine) -> Iterator[TestClient]:
+    with app_client(db_engine) as test_client:
+        yield test_client
@@ -0,0 +1,140 @@
+"""Time the project read paths before and after the JSON fast path.
+
+GET /projects changed in two ways: the ORM query with selectinload became one
+aggregate SQL query, and model validation + serialization became a row
+adapter. The variants below separate the two effects:
+
+    TEST_DATABASE_URL=postgresql+psycopg://... \\
+        poetry run python -m tests.perf.benchmark_read_paths [--projects N]
+
+Each variant runs against a throwaway database seeded like tests/perf and
+reports the median wall and CPU time of this process over the runs.
+"""
+
+import argparse
+import statistics
+import time
+from collections.abc import Callable
+
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
+
+from src.models import Project, ProjectPlace
+from src.schemas import ProjectPlaceResponse, ProjectResponse, ProjectWithPlacesResponse
+from src.services.projects import (
+    _get_project_or_404,
+    _list_projects_stmt,
+    get_project,
+    get_project_json,
+    list_project_places_json,
+    list_projects_json,
+)
+from tests.perf.seed import seed
+from tests.support import TEST_DATABASE_URL, migrated_database
+
+projects_model_adapter = TypeAdapter(list[ProjectResponse])
+places_model_adapter = TypeAdapter(list[ProjectPlaceResponse])
+project_model_adapter = TypeAdapter(ProjectWithPlacesResponse)
+
+
+def list_projects_orm_models(db: Session) -> bytes:
+    """The original GET /projects: selectinload every place, then models."""
+    stmt = select(Project).options(selectinload(Project.places)).order_by(Project.id)
+    projects = [
+        ProjectResponse(
+            id=project.id,
+            name=project.name,
+            description=project.description,
+            start_date=project.start_date,
+            completed=bool(project.places)
+            and all(place.visited for place in project.places),
+            places_count=len(project.places),
+            created_at=project.created_at,
+            updated_at=project.updated_at,
+        )
+        for project in db.execute(stmt).scalars()
+    ]
+    return projects_model_adapter.dump_json(projects)
+
+
+def list_projects_sql_models(db: Session) -> bytes:
+    """The aggregate query, still validated into models."""
+    projects = [
+        ProjectResponse.model_validate(row)
+        for row in db.execute(_list_projects_stmt()).mappings()
+    ]
+    return projects_model_adapter.dump_json(projects)
+
+
+def list_project_places_orm_models(db: Session, project_id: int) -> bytes:
+    _get_project_or_404(db, project_id)
+    stmt = (
+        select(ProjectPlace)
+        .where(ProjectPlace.project_id == project_id)
+        .order_by(ProjectPlace.id)
+    )
+    places = [ProjectPlaceResponse.model_validate(place) for place in db.scalars(stmt)]
+    return places_model_adapter.dump_json(places)
+
+
+def get_project_orm_models(db: Session, project_id: int) -> bytes:
+    return project_model_adapter.dump_json(get_project(db, project_id))
+
+
+def _measure(db: Session, call: Callable[[], bytes], runs: int) -> tuple[float, float]:
+    call()
+    walls, cpus = [], []
+    for _ in range(runs):
+        db.expunge_all()
+        wall, cpu = time.perf_counter(), time.process_time()
+        call()
+        walls.append(time.perf_counter() - wall)
+        cpus.append(time.process_time() - cpu)
+        db.rollback()
+    return statistics.median(walls) * 1000, statistics.median(cpus) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m tests.perf.benchmark_read_paths")
+    parser.add_argument("--projects", type=int, default=5000)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+    if not TEST_DATABASE_URL:
+        parser.error("TEST_DATABASE_URL is not set")
+
+    with migrated_database("bench") as engine:
+        seed(engine, args.projects)
+        project_id = 1
+        with Session(engine) as db:
+            cases = {
+                "GET /projects": {
+                    "orm + models (before)": lambda: list_projects_orm_models(db),
+                    "aggregate sql + models": lambda: list_projects_sql_models(db),
+                    "aggregate sql + adapter (after)": lambda: list_projects_json(db),
+                },
+                "GET /projects/{id}": {
+                    "orm + models (before)": lambda: get_project_orm_models(
+                        db, project_id
+                    ),
+                    "sql + adapter (after)": lambda: get_project_json(db, project_id),
+                },
+                "GET /projects/{id}/places": {
+                    "orm + models (before)": lambda: list_project_places_orm_models(
+                        db, project_id
+                    ),
+                    "sql + adapter (after)": lambda: list_project_places_json(
+                        db, project_id
+                    ),
+                },
+            }
+            print(f"{args.projects} projects, median of {args.runs} runs")
+            for endpoint, variants in cases.items():
+                print(endpoint)
+                for name, call in variants.items():
+                    wall, cpu = _measure(db, call, args.runs)
+                    print(f"  {name:<34} wall {wall:8.1f} ms  cpu {cpu:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine
+
+from tests.perf.harness import StatementRecorder
+from tests.perf.seed import seed
+from tests.support import app_client, migrated_database
+
+
+@pytest.fixture(scope="session")
+def perf_engine() -> Iterator[Engine]:
+    with migrated_database("perf") as engine:
+        seed(engine)
+        yield engine
+
+
+@pytest.fixture(scope="session")
+def client(perf_engine: Engine) -> Iterator[TestClient]:
+    with app_client(perf_engine) as test_client:
+        # Warm the pool so connection setup queries are not recorded.
+        test_client.get("/projects/1/places")
+        yield test_client
+
+
+@pytest.fixture
+def recorder(perf_engine: Engine) -> StatementRecorder:
+    return StatementRecorder(perf_engine)
@@ -0,0 +1,172 @@
+import json
+import os
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import Engine, event
+
+SNAPSHOT_DIR = Path(__file__).parent / "snapshots"
+UPDATE_SNAPSHOTS = os.getenv("UPDATE_PERF_SNAPSHOTS") == "1"
+
+# Tables seeded at realistic size; a sequential scan on them is a regression
+# unless the test case explicitly allows it (e.g. listing every project).
+LARGE_TABLES = frozenset({"projects", "project_places"})
+
+
+@dataclass(slots=True)
+class RecordedStatement:
+    sql: str
+    parameters: Any
+
+
+@dataclass(slots=True)
+class StatementSnapshot:
+    sql: str
+    plan: dict
+
+    def to_json(self) -> dict:
+        return {"sql": self.sql, "plan": self.plan}
+
+
+class StatementRecorder:
+    def __init__(self, engine: Engine) -> None:
+        self._engine = engine
+        self.statements: list[RecordedStatement] = []
+
+    def _before_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        # insertmanyvalues batches arrive as a single dict; real executemany
+        # calls carry a list, of which the first row is enough to EXPLAIN.
+        if executemany and isinstance(parameters, (list, tuple)):
+            parameters = parameters[0]
+        self.statements.append(RecordedStatement(statement, parameters))
+
+    @contextmanager
+    def record(self) -> Iterator[list[RecordedStatement]]:
+        self.statements = []
+        event.listen(self._engine, "before_cursor_execute", self._before_cursor_execute)
+        try:
+            yield self.statements
+        finally:
+            event.remove(
+                self._engine, "before_cursor_execute", self._before_cursor_execute
+            )
+
+
+def _plan_shape(node: dict) -> dict:
+    shape = {"node": node["Node Type"]}
+    if "Relation Name" in node:
+        shape["relation"] = node["Relation Name"]
+    if "Index Name" in node:
+        shape["index"] = node["Index Name"]
+    children = [_plan_shape(child) for child in node.get("Plans", [])]
+    if children:
+        shape["children"] = children
+    return shape
+
+
+def _walk(shape: dict) -> Iterator[dict]:
+    yield shape
+    for child in shape.get("children", []):
+        yield from _walk(child)
+
+
+def _seq_scans(shape: dict) -> set[str]:
+    return {node["relation"] for node in _walk(shape) if node["node"] == "Seq Scan"}
+
+
+def _indexes(shape: dict) -> set[str]:
+    return {node["index"] for node in _walk(shape) if "index" in node}
+
+
+def _describe(shape: dict) -> str:
+    label = shape["node"]
+    if "relation" in shape:
+        label += f" on {shape['relation']}"
+    children = shape.get("children", [])
+    if children:
+        label += f" ({', '.join(_describe(child) for child in children)})"
+    return label
+
+
+def explain(engine: Engine, statement: RecordedStatement) -> StatementSnapshot:
+    with engine.connect() as conn:
+        plan = conn.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {statement.sql}", statement.parameters
+        ).scalar_one()
+    return StatementSnapshot(sql=statement.sql, plan=_plan_shape(plan[0]["Plan"]))
+
+
+def load_snapshot(name: str) -> list[StatementSnapshot] | None:
+    path = SNAPSHOT_DIR / f"{name}.json"
+    if not path.exists():
+        return None
+    data = json.loads(path.read_text())
+    return [StatementSnapshot(**statement) for statement in data["statements"]]
+
+
+def write_snapshot(name: str, statements: list[StatementSnapshot]) -> None:
+    SNAPSHOT_DIR.mkdir(exist_ok=True)
+    data = {
+        "statement_count": len(statements),
+        "statements": [statement.to_json() for statement in statements],
+    }
+    path = SNAPSHOT_DIR / f"{name}.json"
+    path.write_text(json.dumps(data, indent=2) + "\n")
+
+
+# SQLAlchemy labels ORM columns as "<table>.<column> AS <table>_<column>" in
+# some versions and not others; the label does not change the query.
+_GENERATED_LABEL = re.compile(r"\b(\w+)\.(\w+) AS \1_\2\b")
+
+
+def _normalize_sql(sql: str) -> str:
+    sql = re.sub(r"\s+", " ", sql).strip()
+    return _GENERATED_LABEL.sub(r"\1.\2", sql)
+
+
+def find_regressions(
+    expected: list[StatementSnapshot],
+    actual: list[StatementSnapshot],
+    allowed_seq_scans: frozenset[str] = frozenset(),
+) -> list[str]:
+    problems: list[str] = []
+    if len(actual) != len(expected):
+        problems.append(
+            f"{len(actual)} SQL statements executed, snapshot has {len(expected)}"
+        )
+
+    # Statements are matched by SQL text, not position, so an added or
+    # removed query is not blamed on the plans of the ones after it.
+    unmatched = list(expected)
+    for position, after in enumerate(actual, start=1):
+        for table in sorted(
+            (_seq_scans(after.plan) & LARGE_TABLES) - allowed_seq_scans
+        ):
+            problems.append(f"statement {position}: sequential scan on {table}")
+
+        sql = _normalize_sql(after.sql)
+        before = next(
+            (snapshot for snapshot in unmatched if _normalize_sql(snapshot.sql) == sql),
+            None,
+        )
+        if before is None:
+            problems.append(f"statement {position}: not in the snapshot: {sql}")
+            continue
+        unmatched.remove(before)
+        for index in sorted(_indexes(before.plan) - _indexes(after.plan)):
+            problems.append(f"statement {position}: index {index} no longer used")
+        # An allowed sequential scan leaves no index to lose, so any change to
+        # the plan of such a case counts as a regression.
+        if allowed_seq_scans and after.plan != before.plan:
+            problems.append(
+                f"statement {position}: plan changed from {_describe(before.plan)} "
+                f"to {_describe(after.plan)}"
+            )
+
+    return problems
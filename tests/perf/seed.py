@@ -0,0 +1,51 @@
+import os
+
+from sqlalchemy import Engine, text
+
+SEED_PROJECTS = int(os.getenv("PERF_SEED_PROJECTS", "20000"))
+
+# Every 4th project is fully visited, every 10th has 5 places instead of 10.
+SEED_PROJECTS_SQL = """
+INSERT INTO projects (name, description, start_date, created_at, updated_at)
+SELECT
+    'Project ' || g,
+    CASE WHEN g % 3 = 0 THEN NULL ELSE 'Description of project ' || g END,
+    DATE '2026-01-01' + g % 365,
+    now() - make_interval(days => g % 730),
+    now() - make_interval(days => g % 365)
+FROM generate_series(1, :projects) AS g
+"""
+
+SEED_PLACES_SQL = """
+INSERT INTO project_places (
+    project_id, external_id, title, artist_title, image_id, notes, visited,
+    visited_at, created_at, updated_at
+)
+SELECT
+    p.id,
+    n * 100000 + p.id % 99991,
+    'Artwork ' || n || '-' || p.id,
+    CASE WHEN n % 2 = 0 THEN 'Artist ' || n END,
+    md5(p.id::text || n::text),
+    NULL,
+    p.id % 4 = 0,
+    CASE WHEN p.id % 4 = 0 THEN p.created_at + interval '1 day' END,
+    p.created_at,
+    p.updated_at
+FROM projects AS p
+CROSS JOIN generate_series(1, 10) AS n
+WHERE n <= CASE WHEN p.id % 10 = 0 THEN 5 ELSE 10 END
+"""
+
+
+def seed(engine: Engine, projects: int = SEED_PROJECTS) -> None:
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE projects DISABLE TRIGGER USER"))
+        conn.execute(text("ALTER TABLE project_places DISABLE TRIGGER USER"))
+        conn.execute(text(SEED_PROJECTS_SQL), {"projects": projects})
+        conn.execute(text(SEED_PLACES_SQL))
+        conn.execute(text("ALTER TABLE projects ENABLE TRIGGER USER"))
+        conn.execute(text("ALTER TABLE project_places ENABLE TRIGGER USER"))
+        conn.execute(text("SELECT stats_rebuild()"))
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("ANALYZE"))
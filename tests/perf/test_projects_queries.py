@@ -0,0 +1,145 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, text
+
+from tests.perf.harness import (
+    UPDATE_SNAPSHOTS,
+    StatementRecorder,
+    explain,
+    find_regressions,
+    load_snapshot,
+    write_snapshot,
+)
+
+# Seeded timestamps are whole days back from seeding, up to 729 days (created)
+# and 364 days (updated). The cutoffs sit half a day between them and match a
+# few hundred projects, enough for stable estimates; created_before needs two
+# batches.
+CREATED_BEFORE = (
+    datetime.now(timezone.utc) - timedelta(days=700, hours=12)
+).isoformat()
+UPDATED_BEFORE = (
+    datetime.now(timezone.utc) - timedelta(days=360, hours=12)
+).isoformat()
+
+# One case per route in src/routers/projects.py, plus one per bulk-delete
+# filter. Seeded project ids are stable: 4 is fully visited, 10 has room for
+# more places.
+CASES: list[tuple[str, str, str, dict[str, Any], int]] = [
+    (
+        "create_project",
+        "POST",
+        "/projects",
+        {"json": {"name": "Perf", "places": [{"external_id": 1}, {"external_id": 2}]}},
+        201,
+    ),
+    ("list_projects", "GET", "/projects", {}, 200),
+    ("get_project", "GET", "/projects/2", {}, 200),
+    ("update_project", "PATCH", "/projects/3", {"json": {"name": "Renamed"}}, 200),
+    ("delete_project", "DELETE", "/projects/5", {}, 204),
+    ("delete_project_visited", "DELETE", "/projects/4", {}, 409),
+    (
+        "bulk_delete_projects",
+        "DELETE",
+        "/projects",
+        {"params": {"ids": [6, 7]}},
+        200,
+    ),
+    (
+        "bulk_delete_projects_created_before",
+        "DELETE",
+        "/projects",
+        {"params": {"created_before": CREATED_BEFORE}},
+        200,
+    ),
+    (
+        "bulk_delete_projects_updated_before",
+        "DELETE",
+        "/projects",
+        {"params": {"updated_before": UPDATED_BEFORE}},
+        200,
+    ),
+    (
+        "add_project_place",
+        "POST",
+        "/projects/10/places",
+        {"json": {"external_id": 3}},
+        201,
+    ),
+    ("list_project_places", "GET", "/projects/2/places", {}, 200),
+    ("get_project_place", "GET", "/projects/2/places/{place_2}", {}, 200),
+    (
+        "update_project_place",
+        "PATCH",
+        "/projects/9/places/{place_9}",
+        {"json": {"visited": True}},
+        200,
+    ),
+]
+
+
+# Listing every project with its place counts reads both tables in full, so a
+# hash join over sequential scans is the expected plan. projects.created_at and
+# projects.updated_at are not indexed, so every purge batch and the remaining
+# count scan projects; a purge this large also hashes the visited places for
+# the anti-join. Allowlisted cases must match their snapshot's plan shape
+# exactly instead.
+ALLOWED_SEQ_SCANS: dict[str, frozenset[str]] = {
+    "list_projects": frozenset({"projects", "project_places"}),
+    "bulk_delete_projects_created_before": frozenset({"projects", "project_places"}),
+    "bulk_delete_projects_updated_before": frozenset({"projects"}),
+}
+
+
+@pytest.fixture(scope="module")
+def place_ids(perf_engine: Engine) -> dict[str, int]:
+    with perf_engine.connect() as conn:
+        rows = conn.execute(
+            text(
+                "SELECT project_id, min(id) FROM project_places "
+                "WHERE project_id IN (2, 9) GROUP BY project_id"
+            )
+        ).all()
+    return {f"place_{project_id}": place_id for project_id, place_id in rows}
+
+
+@pytest.mark.parametrize(
+    ("name", "method", "url", "kwargs", "status_code"),
+    CASES,
+    ids=[case[0] for case in CASES],
+)
+def test_query_plans(
+    client: TestClient,
+    perf_engine: Engine,
+    recorder: StatementRecorder,
+    place_ids: dict[str, int],
+    name: str,
+    method: str,
+    url: str,
+    kwargs: dict[str, Any],
+    status_code: int,
+) -> None:
+    with recorder.record() as statements:
+        response = client.request(method, url.format(**place_ids), **kwargs)
+    assert response.status_code == status_code, response.text
+
+    actual = [explain(perf_engine, statement) for statement in statements]
+    expected = load_snapshot(name)
+
+    if UPDATE_SNAPSHOTS:
+        write_snapshot(name, actual)
+        return
+
+    assert expected is not None, (
+        f"No snapshot for {name}; run with UPDATE_PERF_SNAPSHOTS=1 to create it"
+    )
+    problems = find_regressions(
+        expected, actual, ALLOWED_SEQ_SCANS.get(name, frozenset())
+    )
+    assert not problems, "\n".join(
+        [f"{method} {url} regressed:", *problems, "SQL executed:"]
+        + [statement.sql for statement in actual]
+    )
@@ -0,0 +1,83 @@
+import os
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import sessionmaker
+
+from src.clients.artic import ArticArtwork
+from src.database import get_db
+from src.deps import get_artic_client
+from src.main import app
+
+ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+class FakeArticClient:
+    async def get_artwork(self, external_id: int) -> ArticArtwork:
+        return ArticArtwork(
+            external_id=external_id,
+            title=f"Artwork {external_id}",
+            artist_title="Artist",
+            image_id="image",
+        )
+
+
+@contextmanager
+def migrated_database(prefix: str) -> Iterator[Engine]:
+    """Create a throwaway database on TEST_DATABASE_URL's server, migrated to head."""
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+
+    admin_engine = create_engine(TEST_DATABASE_URL, isolation_level="AUTOCOMMIT")
+    database = f"{prefix}_{uuid.uuid4().hex[:12]}"
+    with admin_engine.connect() as conn:
+        conn.execute(text(f'CREATE DATABASE "{database}"'))
+
+    url = make_url(TEST_DATABASE_URL).set(database=database)
+    engine = create_engine(url)
+    try:
+        previous_url = os.environ.get("DATABASE_URL")
+        os.environ["DATABASE_URL"] = url.render_as_string(hide_password=False)
+        try:
+            command.upgrade(Config(os.path.join(ROOT_DIR, "alembic.ini")), "head")
+        finally:
+            if previous_url is None:
+                os.environ.pop("DATABASE_URL")
+            else:
+                os.environ["DATABASE_URL"] = previous_url
+
+        yield engine
+    finally:
+        engine.dispose()
+        with admin_engine.connect() as conn:
+            conn.execute(text(f'DROP DATABASE IF EXISTS "{database}" WITH (FORCE)'))
+        admin_engine.dispose()
+
+
+@contextmanager
+def app_client(engine: Engine) -> Iterator[TestClient]:
+    """TestClient for the app with the database and Art Institute API swapped out."""
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_artic_client] = FakeArticClient
+    try:
+        with TestClient(app) as test_client:
+            yield test_client
+    finally:
+        app.dependency_overrides.clear()
@@ -0,0 +1,113 @@
+from datetime import datetime, timezone
+
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, text
+from sqlalchemy.orm import Session
+
+from src.services.projects import bulk_delete_projects
+
+CUTOFF = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _insert_projects(engine: Engine, count: int, updated_at: str) -> list[int]:
+    with engine.begin() as conn:
+        ids = (
+            conn.execute(
+                text(
+                    "INSERT INTO projects (name, created_at, updated_at) "
+                    "SELECT 'Project ' || g, :updated_at, :updated_at "
+                    "FROM generate_series(1, :count) AS g RETURNING id"
+                ),
+                {"count": count, "updated_at": updated_at},
+            )
+            .scalars()
+            .all()
+        )
+        conn.execute(
+            text(
+                "INSERT INTO project_places "
+                "(project_id, external_id, title, created_at, updated_at) "
+                "SELECT id, 1, 'Artwork', :updated_at, :updated_at "
+                "FROM projects WHERE id = ANY(:ids)"
+            ),
+            {"ids": ids, "updated_at": updated_at},
+        )
+    return ids
+
+
+def _existing(engine: Engine, ids: list[int]) -> list[int]:
+    with engine.connect() as conn:
+        return (
+            conn.execute(
+                text("SELECT id FROM projects WHERE id = ANY(:ids) ORDER BY id"),
+                {"ids": ids},
+            )
+            .scalars()
+            .all()
+        )
+
+
+def test_bulk_delete_requires_a_filter(client: TestClient):
+    response = client.delete("/projects")
+
+    assert response.status_code == 422
+
+
+def test_bulk_delete_skips_projects_with_visited_places(
+    client: TestClient, db_engine: Engine
+):
+    ids = _insert_projects(db_engine, 2, "2025-06-01T00:00:00Z")
+    with db_engine.begin() as conn:
+        conn.execute(
+            text("UPDATE project_places SET visited = true WHERE project_id = :id"),
+            {"id": ids[0]},
+        )
+
+    response = client.delete("/projects", params={"ids": ids})
+
+    assert response.status_code == 200
+    assert response.json() == {"deleted": 1, "remaining": 0}
+    assert _existing(db_engine, ids) == [ids[0]]
+
+
+def test_bulk_delete_runs_batches_until_nothing_is_left(db_engine: Engine):
+    ids = _insert_projects(db_engine, 7, "2025-06-01T00:00:00Z")
+
+    with Session(db_engine) as db:
+        result = bulk_delete_projects(db, created_before=CUTOFF, batch_size=2)
+
+    assert (result.deleted, result.remaining) == (7, 0)
+    assert _existing(db_engine, ids) == []
+
+
+def test_bulk_delete_reports_projects_locked_by_other_requests(db_engine: Engine):
+    ids = _insert_projects(db_engine, 5, "2025-06-01T00:00:00Z")
+
+    with db_engine.connect() as other:
+        other.execute(
+            text("SELECT id FROM projects WHERE id = :id FOR UPDATE"), {"id": ids[0]}
+        )
+        with Session(db_engine) as db:
+            result = bulk_delete_projects(db, created_before=CUTOFF, batch_size=2)
+        other.rollback()
+
+    assert (result.deleted, result.remaining) == (4, 1)
+    assert _existing(db_engine, ids) == [ids[0]]
+
+
+def test_bulk_delete_updated_before_considers_place_updates(db_engine: Engine):
+    untouched, place_edited = _insert_projects(db_engine, 2, "2025-06-01T00:00:00Z")
+    with db_engine.begin() as conn:
+        conn.execute(
+            text(
+                "UPDATE project_places SET notes = 'Edited', updated_at = now() "
+                "WHERE project_id = :id"
+            ),
+            {"id": place_edited},
+        )
+
+    with Session(db_engine) as db:
+        result = bulk_delete_projects(db, updated_before=CUTOFF)
+
+    assert result.deleted == 1
+    assert _existing(db_engine, [untouched, place_edited]) == [place_edited]
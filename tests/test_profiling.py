@@ -0,0 +1,206 @@
+import asyncio
+import sys
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from src import deps, profiling
+from src.clients import artic
+from src.clients.artic import ArticClient
+from src.profiling import ProfiledRoute, ProfileStore, instrument_engine
+from src.routers import admin
+from src.routers.admin import router as admin_router
+
+ADMIN_TOKEN = "test-admin-token"
+ADMIN_HEADERS = {"Authorization": f"Bearer {ADMIN_TOKEN}"}
+SLOW_REQUEST_MS = 100
+
+
+def _busy(duration_ms: float) -> None:
+    deadline = time.perf_counter() + duration_ms / 1000
+    while time.perf_counter() < deadline:
+        pass
+
+
+@pytest.fixture(scope="module")
+def sqlite_engine() -> Iterator[Engine]:
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    instrument_engine(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def store(monkeypatch: pytest.MonkeyPatch) -> ProfileStore:
+    store = ProfileStore(max_captures=3)
+    monkeypatch.setattr(profiling, "profile_store", store)
+    monkeypatch.setattr(admin, "profile_store", store)
+    monkeypatch.setattr(profiling, "PROFILING_SAMPLE_RATE", 0.0)
+    monkeypatch.setattr(profiling, "PROFILING_SLOW_REQUEST_MS", SLOW_REQUEST_MS)
+    monkeypatch.setattr(deps, "ADMIN_TOKEN", ADMIN_TOKEN)
+    return store
+
+
+@pytest.fixture
+def client(
+    store: ProfileStore, sqlite_engine: Engine, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[TestClient]:
+    real_async_client = httpx.AsyncClient
+
+    def artic_api(request: httpx.Request) -> httpx.Response:
+        external_id = int(request.url.path.rsplit("/", 1)[1])
+        return httpx.Response(
+            200, json={"data": {"id": external_id, "title": f"Artwork {external_id}"}}
+        )
+
+    monkeypatch.setattr(
+        artic.httpx,
+        "AsyncClient",
+        lambda **kwargs: real_async_client(
+            transport=httpx.MockTransport(artic_api), **kwargs
+        ),
+    )
+
+    router = APIRouter(route_class=ProfiledRoute)
+
+    @router.get("/fast")
+    def fast_endpoint() -> dict:
+        return {}
+
+    @router.get("/slow/{n}")
+    def slow_endpoint(n: int) -> dict:
+        _busy(SLOW_REQUEST_MS * 2)
+        return {"n": n}
+
+    @router.get("/work/{n}")
+    async def work_endpoint(n: int) -> dict:
+        with sqlite_engine.connect() as conn:
+            conn.execute(text(f"SELECT {n}"))
+        await asyncio.sleep(0.02)
+        artwork = await ArticClient().get_artwork(n)
+        _busy(SLOW_REQUEST_MS)
+        return {"title": artwork.title}
+
+    app = FastAPI()
+    app.include_router(router)
+    app.include_router(admin_router)
+    app.middleware("http")(profiling.profiling_middleware)
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def _captures(client: TestClient) -> list[dict]:
+    response = client.get("/admin/profiles", headers=ADMIN_HEADERS)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_admin_requires_token(client: TestClient):
+    missing = client.get("/admin/profiles")
+    wrong = client.get("/admin/profiles", headers={"Authorization": "Bearer nope"})
+
+    assert missing.status_code == 401
+    assert missing.headers["www-authenticate"] == "Bearer"
+    assert wrong.status_code == 403
+    assert client.get("/admin/profiles", headers=ADMIN_HEADERS).status_code == 200
+
+
+def test_slow_request_is_kept_and_fast_request_dropped(client: TestClient):
+    assert client.get("/fast").status_code == 200
+    assert client.get("/slow/1").status_code == 200
+
+    captures = _captures(client)
+    assert [(capture["path"], capture["reason"]) for capture in captures] == [
+        ("/slow/1", "slow")
+    ]
+    assert captures[0]["duration_ms"] >= SLOW_REQUEST_MS
+    assert captures[0]["samples_count"] > 0
+
+
+def test_store_keeps_newest_max_captures(client: TestClient):
+    for n in range(1, 5):
+        client.get(f"/slow/{n}")
+
+    assert [capture["path"] for capture in _captures(client)] == [
+        "/slow/4",
+        "/slow/3",
+        "/slow/2",
+    ]
+
+
+def test_folded_output_contains_endpoint_frame(client: TestClient):
+    client.get("/slow/1")
+    (capture,) = _captures(client)
+
+    response = client.get(
+        f"/admin/profiles/{capture['id']}/folded", headers=ADMIN_HEADERS
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-disposition"] == (
+        f'attachment; filename="profile-{capture["id"]}.folded"'
+    )
+    lines = response.text.splitlines()
+    assert lines
+    for line in lines:
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0
+        assert stack.startswith(
+            "client.<locals>.slow_endpoint (tests/test_profiling.py:"
+        )
+    assert any("_busy (tests/test_profiling.py:" in line for line in lines)
+
+
+def test_sql_and_artic_calls_are_attributed_to_their_request(client: TestClient):
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        responses = list(pool.map(lambda n: client.get(f"/work/{n}"), [11, 12, 13]))
+    assert [response.status_code for response in responses] == [200, 200, 200]
+
+    summaries = _captures(client)
+    assert sorted(summary["path"] for summary in summaries) == [
+        "/work/11",
+        "/work/12",
+        "/work/13",
+    ]
+    for summary in summaries:
+        n = summary["path"].rsplit("/", 1)[1]
+        capture = client.get(
+            f"/admin/profiles/{summary['id']}", headers=ADMIN_HEADERS
+        ).json()
+        assert [sql["statement"] for sql in capture["sql_statements"]] == [
+            f"SELECT {n}"
+        ]
+        assert [
+            (call["service"], call["url"], call["status_code"])
+            for call in capture["external_calls"]
+        ] == [("artic", f"{artic.ARTIC_BASE_URL}/artworks/{n}", 200)]
+
+
+def test_unknown_capture_returns_404(client: TestClient):
+    for path in ("/admin/profiles/missing", "/admin/profiles/missing/folded"):
+        response = client.get(path, headers=ADMIN_HEADERS)
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": "Profile not found"}
+
+
+def test_frame_labels_escape_the_folded_separator():
+    namespace: dict = {}
+    exec(
+        compile("def frame():\n    return sys._getframe()", "a;b.py", "exec"),
+        {"sys": sys},
+        namespace,
+    )
+
+    assert profiling._frame_label(namespace["frame"]()) == "frame (a,b.py:1)"
@@ -0,0 +1,105 @@
+from datetime import date, datetime, timedelta, timezone
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.schemas import ProjectPlaceResponse, ProjectResponse, ProjectWithPlacesResponse
+from src.serialization import (
+    json_response,
+    project_places_adapter,
+    project_with_places_adapter,
+    projects_adapter,
+)
+
+IST = timezone(timedelta(hours=5, minutes=30))
+
+PLACES = [
+    {
+        "id": 1,
+        "project_id": 7,
+        "external_id": 27992,
+        "title": "Un dimanche après-midi à l'Île de la Grande Jatte",
+        "artist_title": "Georges Seurat",
+        "image_id": "2d484387-2509-5e8e-2c43-22f9981972eb",
+        "notes": 'Zaal 3 — 東京から \U0001f3a8 "quoted"\n',
+        "visited": True,
+        "created_at": datetime(2026, 3, 1, 9, 30, 0, 123456, tzinfo=timezone.utc),
+        "updated_at": datetime(2026, 3, 2, 18, 5, 59, tzinfo=IST),
+    },
+    {
+        "id": 2,
+        "project_id": 7,
+        "external_id": 16568,
+        "title": "Water Lilies",
+        "artist_title": None,
+        "image_id": None,
+        "notes": None,
+        "visited": False,
+        "created_at": datetime(2026, 3, 1, 9, 30, tzinfo=timezone.utc),
+        "updated_at": datetime(2026, 3, 1, 9, 30, tzinfo=timezone.utc),
+    },
+]
+
+PROJECT = {
+    "id": 7,
+    "name": "Ruta por Galicia – Óbidos",
+    "description": None,
+    "start_date": date(2026, 4, 30),
+    "completed": False,
+    "places_count": 2,
+    "created_at": datetime(2026, 3, 1, 9, 29, 59, 999999, tzinfo=IST),
+    "updated_at": datetime(2026, 3, 1, 9, 30, tzinfo=timezone.utc),
+}
+
+
+def _client() -> TestClient:
+    """Pairs each fast endpoint with the response_model path it replaces."""
+    app = FastAPI()
+
+    @app.get("/model/places", response_model=list[ProjectPlaceResponse])
+    def model_places():
+        return [ProjectPlaceResponse.model_validate(place) for place in PLACES]
+
+    @app.get("/fast/places")
+    def fast_places():
+        return json_response(project_places_adapter.dump_json(PLACES))
+
+    @app.get("/model/projects", response_model=list[ProjectResponse])
+    def model_projects():
+        return [ProjectResponse.model_validate(PROJECT)]
+
+    @app.get("/fast/projects")
+    def fast_projects():
+        return json_response(projects_adapter.dump_json([PROJECT]))
+
+    @app.get("/model/project", response_model=ProjectWithPlacesResponse)
+    def model_project():
+        return ProjectWithPlacesResponse.model_validate({**PROJECT, "places": PLACES})
+
+    @app.get("/fast/project")
+    def fast_project():
+        return json_response(
+            project_with_places_adapter.dump_json({**PROJECT, "places": PLACES})
+        )
+
+    return TestClient(app)
+
+
+def test_row_adapters_match_response_models_byte_for_byte():
+    client = _client()
+
+    for path in ("places", "projects", "project"):
+        expected = client.get(f"/model/{path}")
+        actual = client.get(f"/fast/{path}")
+
+        assert actual.content == expected.content, path
+        assert actual.headers["content-type"] == expected.headers["content-type"]
+
+
+def test_row_adapters_match_model_dump_json():
+    assert (
+        project_with_places_adapter.dump_json({**PROJECT, "places": PLACES})
+        == ProjectWithPlacesResponse.model_validate({**PROJECT, "places": PLACES})
+        .model_dump_json()
+        .encode()
+    )
@@ -0,0 +1,153 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, text
+
+SUMMARY_TABLES = {
+    "project_stats": "project_id",
+    "daily_stats": "day",
+    "artwork_imports": "external_id",
+    "artwork_daily_imports": "day, external_id",
+}
+
+
+def _snapshot(engine: Engine) -> dict[str, list[tuple]]:
+    with engine.connect() as conn:
+        return {
+            table: [
+                tuple(row)
+                for row in conn.execute(text(f"SELECT * FROM {table} ORDER BY {key}"))
+            ]
+            for table, key in SUMMARY_TABLES.items()
+        }
+
+
+def _run(engine: Engine, sql: str, **params) -> list:
+    with engine.begin() as conn:
+        result = conn.execute(text(sql), params)
+        return result.scalars().all() if result.returns_rows else []
+
+
+def _create_project(client: TestClient, *external_ids: int) -> dict:
+    response = client.post(
+        "/projects",
+        json={
+            "name": "Trip",
+            "places": [{"external_id": external_id} for external_id in external_ids],
+        },
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+def _set_visited(client: TestClient, project: dict, visited: bool) -> None:
+    for place in project["places"]:
+        response = client.patch(
+            f"/projects/{project['id']}/places/{place['id']}",
+            json={"visited": visited},
+        )
+        assert response.status_code == 200
+
+
+def test_incremental_stats_match_rebuild(client: TestClient, db_engine: Engine):
+    # January history, inserted with explicit timestamps in multi-row statements.
+    (january_id,) = _run(
+        db_engine,
+        "INSERT INTO projects (name, created_at) "
+        "VALUES ('January', '2026-01-10T12:00:00Z') RETURNING id",
+    )
+    _run(
+        db_engine,
+        "INSERT INTO project_places "
+        "(project_id, external_id, title, visited, visited_at, created_at) "
+        "VALUES (:id, 101, 'A', true, '2026-01-12T08:00:00Z', '2026-01-10T12:00:00Z'), "
+        "(:id, 102, 'B', true, '2026-01-12T09:00:00Z', '2026-01-10T12:00:00Z')",
+        id=january_id,
+    )
+    (cascaded_id,) = _run(
+        db_engine,
+        "INSERT INTO projects (name, created_at) "
+        "VALUES ('Cascaded', '2026-01-11T12:00:00Z') RETURNING id",
+    )
+    _run(
+        db_engine,
+        "INSERT INTO project_places (project_id, external_id, title, created_at) "
+        "VALUES (:id, 101, 'A', '2026-01-11T12:00:00Z'), "
+        "(:id, 103, 'C', '2026-01-11T12:00:00Z')",
+        id=cascaded_id,
+    )
+    # Multi-row update completes the project; visited_at defaults to now().
+    _run(
+        db_engine,
+        "UPDATE project_places SET visited = true WHERE project_id = :id",
+        id=cascaded_id,
+    )
+
+    completed = _create_project(client, 1, 2, 3)
+    response = client.post(
+        f"/projects/{completed['id']}/places", json={"external_id": 4}
+    )
+    assert response.status_code == 201
+    completed = client.get(f"/projects/{completed['id']}").json()
+    _set_visited(client, completed, True)
+    _set_visited(client, {**completed, "places": completed["places"][:1]}, False)
+    _set_visited(client, completed, True)
+    response = client.patch(
+        f"/projects/{completed['id']}/places/{completed['places'][0]['id']}",
+        json={"notes": "Notes only"},
+    )
+    assert response.status_code == 200
+
+    partial = _create_project(client, 2, 5, 6)
+    _set_visited(client, {**partial, "places": partial["places"][:1]}, True)
+    # Single-row delete of an unvisited place.
+    _run(
+        db_engine,
+        "DELETE FROM project_places WHERE id = :id",
+        id=partial["places"][1]["id"],
+    )
+
+    bulk = [_create_project(client, 1, 7)["id"] for _ in range(3)]
+    response = client.delete("/projects", params={"ids": bulk})
+    assert response.status_code == 200
+    assert response.json()["deleted"] == 3
+
+    single = _create_project(client, 8)
+    assert client.delete(f"/projects/{single['id']}").status_code == 204
+    # FK cascade of a completed project, bypassing the visited-places rule.
+    _run(db_engine, "DELETE FROM projects WHERE id = :id", id=cascaded_id)
+
+    january = {"date_from": "2026-01-01", "date_to": "2026-01-31"}
+    pending_totals = client.get("/stats").json()
+    pending_january = client.get("/stats", params=january).json()
+
+    _run(db_engine, "SELECT stats_compact()")
+    assert _run(db_engine, "SELECT count(*) FROM daily_stats_deltas") == [0]
+    assert _run(db_engine, "SELECT count(*) FROM artwork_import_deltas") == [0]
+    incremental = _snapshot(db_engine)
+    assert client.get("/stats").json() == pending_totals
+    assert client.get("/stats", params=january).json() == pending_january
+
+    _run(db_engine, "SELECT stats_rebuild()")
+    assert _snapshot(db_engine) == incremental
+
+    assert pending_january == {
+        "date_from": "2026-01-01",
+        "date_to": "2026-01-31",
+        "projects_created": 1,
+        "projects_completed": 1,
+        "completion_rate": 1.0,
+        "places_imported": 2,
+        "places_visited": 2,
+        "places_visited_per_day": [{"day": "2026-01-12", "places_visited": 2}],
+        "top_artworks": [
+            {"external_id": 102, "imports": 1},
+            {"external_id": 101, "imports": 1},
+        ],
+    }
+    assert pending_totals["projects_created"] == 3
+    assert pending_totals["projects_completed"] == 2
+    assert pending_totals["places_imported"] == 8
+    assert pending_totals["places_visited"] == 7
+    assert pending_totals["top_artworks"][:2] == [
+        {"external_id": 2, "imports": 2},
+        {"external_id": 102, "imports": 1},
+    ]